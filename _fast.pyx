@@ -0,0 +1,86 @@
+# cython: language_level=3
+"""
+Compiled kernels for the k-means hot loops.
+
+Build in place with ``python setup.py build_ext --inplace``. Callers fall back
+to the NumPy implementations when this module has not been built.
+"""
+cimport cython
+cimport openmp
+from cython.parallel cimport prange
+from libc.math cimport INFINITY
+from libc.stdint cimport int64_t
+
+import numpy as np
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def kmeans_assign(const float[:, ::1] X, const float[:, ::1] centroids, int64_t[::1] labels):
+    """
+    Assigns each data point to its nearest centroid.
+
+    Parameters:
+        X (numpy.ndarray): Input data, float32, shape (n_samples, n_features).
+        centroids (numpy.ndarray): Current centroids, float32, shape (k, n_features).
+        labels (numpy.ndarray): Output labels, int64, shape (n_samples,).
+    """
+    cdef Py_ssize_t n = X.shape[0], d = X.shape[1], k = centroids.shape[0]
+    cdef Py_ssize_t i, j, f
+    cdef float dist, diff, best_dist
+    cdef int64_t best
+
+    for i in prange(n, nogil=True, schedule='static'):
+        best = 0
+        best_dist = INFINITY
+        for j in range(k):
+            dist = 0
+            for f in range(d):
+                diff = X[i, f] - centroids[j, f]
+                dist = dist + diff * diff
+            if dist < best_dist:
+                best_dist = dist
+                best = j
+        labels[i] = best
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def kmeans_update(const float[:, ::1] X, const int64_t[::1] labels, float[:, ::1] sums,
+                  int64_t[::1] counts):
+    """
+    Accumulates the per-cluster sums and counts for the given labels. Each
+    thread scatters its block of rows into private buffers, which are reduced
+    at the end, so threads never write to the same cluster.
+
+    Parameters:
+        X (numpy.ndarray): Input data, float32, shape (n_samples, n_features).
+        labels (numpy.ndarray): Labels of the input data points, int64, shape (n_samples,).
+        sums (numpy.ndarray): Output per-cluster sums, float32, shape (k, n_features).
+        counts (numpy.ndarray): Output per-cluster counts, int64, shape (k,).
+    """
+    cdef Py_ssize_t n = X.shape[0], d = X.shape[1], k = sums.shape[0]
+    cdef Py_ssize_t n_chunks = min(openmp.omp_get_max_threads(), max(n, 1))
+    cdef Py_ssize_t chunk = (n + n_chunks - 1) // n_chunks
+    cdef Py_ssize_t t, i, f, start, stop
+    cdef int64_t j
+    cdef float[:, :, ::1] local_sums = np.zeros((n_chunks, k, d), dtype=np.float32)
+    cdef int64_t[:, ::1] local_counts = np.zeros((n_chunks, k), dtype=np.int64)
+
+    for t in prange(n_chunks, nogil=True, schedule='static', num_threads=n_chunks):
+        start = t * chunk
+        stop = min(start + chunk, n)
+        for i in range(start, stop):
+            j = labels[i]
+            local_counts[t, j] += 1
+            for f in range(d):
+                local_sums[t, j, f] += X[i, f]
+
+    sums[:, :] = 0
+    counts[:] = 0
+    with nogil:
+        for t in range(n_chunks):
+            for j in range(k):
+                counts[j] += local_counts[t, j]
+                for f in range(d):
+                    sums[j, f] += local_sums[t, j, f]
@@ -1,21 +1,101 @@
 import numpy as np
 from sklearn.manifold import TSNE
 
+try:
+    import cupy
+    from cuml.manifold import TSNE as CuTSNE
+except ImportError:
+    CuTSNE = None
+
+try:
+    from tsnecuda import TSNE as TsneCudaTSNE
+except ImportError:
+    TsneCudaTSNE = None
+
 
 class TSNEDimensionReducer:
     """
     A class that uses t-SNE to reduce the dimensions of feature vectors.
     """
 
-    def __init__(self, n_components=2):
+    # Below this many samples the GPU start-up cost outweighs its speedup, so 'auto' uses sklearn
+    GPU_MIN_SAMPLES = 10000
+
+    def __init__(self, n_components=2, method='barnes_hut', n_jobs=-1, angle=0.5,
+                 perplexity=30, init='pca', backend='auto'):
         """
         Initializes a new instance of the TSNEDimensionReducer class.
 
         Args:
             n_components (int): The number of components (dimensions) to reduce to.
+            method (str): The gradient calculation method, 'barnes_hut' or 'exact'. Barnes-Hut
+                          only supports up to 3 components, so 'exact' is used above that.
+            n_jobs (int): The number of parallel jobs used for the neighbors search. -1 uses all
+                          processors.
+            angle (float): The Barnes-Hut trade-off between speed and accuracy.
+            perplexity (float): The number of nearest neighbors considered by t-SNE.
+            init (str): The initialization of the embedding, 'pca' or 'random'.
+            backend (str): The t-SNE implementation to use, 'cuml', 'tsnecuda', 'sklearn' or
+                           'auto'. 'auto' uses the first installed GPU backend for inputs of at
+                           least GPU_MIN_SAMPLES samples and sklearn otherwise. The GPU backends
+                           only support 2 components and ignore method, n_jobs and init.
         """
         self.n_components = n_components
-        self.tsne = TSNE(n_components=self.n_components)
+        if self.n_components > 3:
+            method = 'exact'
+        self.method = method
+        self.n_jobs = n_jobs
+        self.angle = angle
+        self.perplexity = perplexity
+        self.init = init
+        self.backend = backend
+        self.gpu_backend = self._select_gpu_backend(backend)
+        self.tsne = None
+
+    def _select_gpu_backend(self, backend):
+        """
+        Validates the requested backend and finds the GPU backend to use, if any.
+
+        Args:
+            backend (str): The requested backend.
+
+        Returns:
+            str or None: The GPU backend to use, or None if only sklearn will be used.
+        """
+        installed = {'cuml': CuTSNE is not None, 'tsnecuda': TsneCudaTSNE is not None}
+        if backend == 'sklearn':
+            return None
+        if backend == 'auto':
+            if self.n_components != 2:
+                return None
+            return next((name for name, ok in installed.items() if ok), None)
+        if backend not in installed:
+            raise ValueError(f"Unknown t-SNE backend: {backend}")
+        if not installed[backend]:
+            raise ImportError(f"t-SNE backend '{backend}' is not installed")
+        if self.n_components != 2:
+            raise ValueError(f"t-SNE backend '{backend}' only supports 2 components, "
+                             f"got {self.n_components}")
+        return backend
+
+    def _create_tsne(self, backend):
+        """
+        Creates the t-SNE estimator for the given backend.
+
+        Args:
+            backend (str): The backend, 'cuml', 'tsnecuda' or 'sklearn'.
+
+        Returns:
+            object: The t-SNE estimator.
+        """
+        if backend == 'cuml':
+            return CuTSNE(n_components=self.n_components, method='barnes_hut',
+                          angle=self.angle, perplexity=self.perplexity)
+        if backend == 'tsnecuda':
+            return TsneCudaTSNE(n_components=self.n_components, theta=self.angle,
+                                perplexity=self.perplexity)
+        return TSNE(n_components=self.n_components, method=self.method, n_jobs=self.n_jobs,
+                    angle=self.angle, perplexity=self.perplexity, init=self.init)
 
     def reduce_dimensions(self, feature_vectors):
         """
@@ -27,4 +107,14 @@ class TSNEDimensionReducer:
         Returns:
             numpy.ndarray: A 2D array of reduced feature vectors.
         """
+        backend = self.gpu_backend or 'sklearn'
+        if self.backend == 'auto' and len(feature_vectors) < self.GPU_MIN_SAMPLES:
+            backend = 'sklearn'
+        self.tsne = self._create_tsne(backend)
+
+        if backend == 'cuml':
+            reduced = self.tsne.fit_transform(cupy.asarray(feature_vectors, dtype=cupy.float32))
+            return reduced.get()
+
+        feature_vectors = np.asarray(feature_vectors, dtype=np.float32)
         return self.tsne.fit_transform(feature_vectors)
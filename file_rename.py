@@ -1,13 +1,17 @@
-import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 categories = ["accordion", "airplanes", "bonsai", "buddha", "Faces", "pigeon", "rhino"]
 
+pairs = []
 for category in categories:
-    directory = "images/" + category
+    directory = Path("images") / category
     add_word = category + "_"
-    for filename in os.listdir(directory):
-        file_path = os.path.join(directory, filename)
-        name, ext = os.path.splitext(filename)
-        new_name = add_word + name + ext
-        new_path = os.path.join(directory, new_name)
-        os.rename(file_path, new_path)
+    for path in directory.iterdir():
+        # Skip files that were already renamed so the script can be re-run safely
+        if not path.name.startswith(add_word):
+            pairs.append((path, directory / (add_word + path.name)))
+
+# Renames are syscall-latency bound and release the GIL, so run them concurrently
+with ThreadPoolExecutor(max_workers=32) as executor:
+    list(executor.map(lambda pair: pair[0].rename(pair[1]), pairs))
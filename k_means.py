@@ -1,59 +1,269 @@
+from functools import partial
+
 import numpy as np
 
+try:
+    from _fast import kmeans_assign, kmeans_update
+except ImportError:
+    kmeans_assign = None
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:
+    njit = None
+
+# Rows of X processed per block in _numpy_step, so the (rows, k) distance
+# temporary stays cache-resident instead of spanning all of X
+_CHUNK_ROWS = 8192
+
+
+def _accumulate(X, labels, out_sums, out_counts):
+    """
+    Accumulates the per-cluster sums and counts for the given labels.
+
+    Parameters:
+        X (numpy.ndarray): Input data, shape (n_samples, n_features).
+        labels (numpy.ndarray): Labels of the input data points, shape (n_samples,).
+        out_sums (numpy.ndarray): Output per-cluster sums, shape (k, n_features).
+        out_counts (numpy.ndarray): Output per-cluster counts, shape (k,).
+    """
+    out_sums[:] = 0
+    np.add.at(out_sums, labels, X)
+    out_counts[:] = np.bincount(labels, minlength=out_sums.shape[0])
+
+
+def _numpy_step(X, centroids, out_sums, out_counts, out_labels):
+    """
+    Assigns each data point to its nearest centroid and accumulates the
+    per-cluster sums and counts, using NumPy/BLAS.
+
+    Parameters:
+        X (numpy.ndarray): Input data, shape (n_samples, n_features).
+        centroids (numpy.ndarray): Current centroids, shape (k, n_features).
+        out_sums (numpy.ndarray): Output per-cluster sums, shape (k, n_features).
+        out_counts (numpy.ndarray): Output per-cluster counts, shape (k,).
+        out_labels (numpy.ndarray): Output labels, shape (n_samples,).
+    """
+    # Uses ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2; ||x||^2 is constant per
+    # row so it does not affect the argmin and is dropped.
+    centroid_sq = np.einsum('ij,ij->i', centroids, centroids)
+    k = centroids.shape[0]
+    out_sums[:] = 0
+    out_counts[:] = 0
+    for start in range(0, X.shape[0], _CHUNK_ROWS):
+        X_chunk = X[start:start + _CHUNK_ROWS]
+        dots = X_chunk @ centroids.T
+        labels = np.argmin(centroid_sq[np.newaxis, :] - 2.0 * dots, axis=1)
+        out_labels[start:start + _CHUNK_ROWS] = labels
+        np.add.at(out_sums, labels, X_chunk)
+        out_counts += np.bincount(labels, minlength=k)
+
+
+def _faiss_step(X, centroids, out_sums, out_counts, out_labels, index):
+    """
+    Equivalent of _numpy_step that finds the nearest centroids with a faiss
+    flat L2 index, which fuses the distance computation and the argmin. The
+    index is created once per fit and refilled with the current centroids.
+    """
+    index.reset()
+    index.add(centroids)
+    _, nearest = index.search(X, 1)
+    out_labels[:] = nearest[:, 0]
+    _accumulate(X, out_labels, out_sums, out_counts)
+
+
+def _cython_step(X, centroids, out_sums, out_counts, out_labels):
+    """
+    Equivalent of _numpy_step using the compiled kernels from _fast.pyx.
+    """
+    kmeans_assign(X, centroids, out_labels)
+    kmeans_update(X, out_labels, out_sums, out_counts)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _numba_kernel(X, centroids, out_sums, out_counts, out_labels, n_chunks):
+        """
+        Single-pass, multi-threaded equivalent of _numpy_step. Each of the
+        n_chunks row blocks accumulates into its own private buffers, which
+        are reduced at the end.
+        """
+        n, d = X.shape
+        k = centroids.shape[0]
+        chunk = (n + n_chunks - 1) // n_chunks
+        local_sums = np.zeros((n_chunks, k, d), dtype=out_sums.dtype)
+        local_counts = np.zeros((n_chunks, k), dtype=out_counts.dtype)
+
+        for t in prange(n_chunks):
+            for i in range(t * chunk, min((t + 1) * chunk, n)):
+                best = 0
+                best_dist = np.inf
+                for j in range(k):
+                    dist = 0.0
+                    for f in range(d):
+                        diff = X[i, f] - centroids[j, f]
+                        dist += diff * diff
+                    if dist < best_dist:
+                        best_dist = dist
+                        best = j
+                out_labels[i] = best
+                local_counts[t, best] += 1
+                for f in range(d):
+                    local_sums[t, best, f] += X[i, f]
+
+        out_sums[:] = 0
+        out_counts[:] = 0
+        for t in range(n_chunks):
+            out_sums += local_sums[t]
+            out_counts += local_counts[t]
+
+    def _numba_step(X, centroids, out_sums, out_counts, out_labels):
+        """
+        Runs _numba_kernel with one row block per numba thread. The thread count
+        is read here rather than inside the kernel so numba can cache it.
+        """
+        n_chunks = min(get_num_threads(), max(X.shape[0], 1))
+        _numba_kernel(X, centroids, out_sums, out_counts, out_labels, n_chunks)
+
+
+def _kmeans_plus_plus_init(X, k, rng):
+    """
+    Chooses initial centroids with the k-means++ seeding strategy.
+
+    Parameters:
+        X (numpy.ndarray): Input data, shape (n_samples, n_features).
+        k (int): Number of clusters.
+        rng (numpy.random.RandomState): Random number generator.
+
+    Returns:
+        centroids (numpy.ndarray): Initial centroids, shape (k, n_features).
+    """
+    n = X.shape[0]
+    centroids = np.empty((k, X.shape[1]), dtype=X.dtype)
+    centroids[0] = X[rng.randint(n)]
+
+    # Squared distance of every point to its closest chosen centroid, using
+    # ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2
+    x_sq = np.einsum('ij,ij->i', X, X).astype(np.float64)
+    closest = np.maximum(x_sq - 2.0 * (X @ centroids[0]) + centroids[0] @ centroids[0], 0)
+
+    for j in range(1, k):
+        total = closest.sum()
+        # Sample the next centroid with probability proportional to its squared distance
+        idx = rng.choice(n, p=closest / total) if total > 0 else rng.randint(n)
+        centroids[j] = X[idx]
+        dist = np.maximum(x_sq - 2.0 * (X @ centroids[j]) + centroids[j] @ centroids[j], 0)
+        np.minimum(closest, dist, out=closest)
+
+    return centroids
+
+
+# The compiled kernels come first. Cython is ahead of numba because it is
+# compiled ahead of time (no JIT warm-up) and measures fastest. faiss only
+# replaces the assignment and still accumulates in a separate NumPy pass, so
+# it is a fallback for when neither compiled kernel is available.
+if kmeans_assign is not None:
+    _kmeans_step = _cython_step
+elif njit is not None:
+    _kmeans_step = _numba_step
+elif faiss is not None:
+    _kmeans_step = _faiss_step
+else:
+    _kmeans_step = _numpy_step
+
 
 class KMeans:
     """
     K-means clustering algorithm.
     """
 
-    def __init__(self, k, random_state=None):
+    def __init__(self, k, random_state=None, init='k-means++'):
         """
         Initializes the KMeans object.
 
         Parameters:
             k (int): Number of clusters.
             random_state (int or None): Random seed used for initializing the centroids.
+            init (str): Centroid initialization method, 'k-means++' or 'random'. Defaults to 'k-means++'.
         """
+        if init not in ('k-means++', 'random'):
+            raise ValueError(f"Unknown init method: {init}")
         self.k = k
         self.centroids = None
         self.random_state = random_state
+        self.init = init
 
-    def fit(self, X, max_iter=100, init_centroids=None):
+    def fit(self, X, max_iter=100, init_centroids=None, tol=1e-4):
         """
         Runs the K-means algorithm to cluster the input data.
 
         Parameters:
             X (numpy.ndarray): Input data, shape (n_samples, n_features).
-            max_iter (int, optional): Maximum number of iterations to perform. Defaults to 100.
+            max_iter (int, optional): Maximum number of iterations to perform, at least 1. Defaults to 100.
             init_centroids (numpy.ndarray, optional): Initial centroids, shape (k, n_features). If None,
-                                                      initial centroids are chosen randomly from the input data.
+                                                      initial centroids are chosen from the input data
+                                                      using the init method.
+            tol (float, optional): Convergence tolerance on the total (Frobenius norm) centroid shift between
+                                   iterations. Defaults to 1e-4.
 
         Returns:
             centroids (numpy.ndarray): Final centroids, shape (k, n_features).
             labels (numpy.ndarray): Labels of the input data points, shape (n_samples,).
         """
+        if max_iter < 1:
+            raise ValueError(f"max_iter must be at least 1, got {max_iter}")
+        if self.k > len(X):
+            raise ValueError(f"k={self.k} must not exceed the number of samples ({len(X)})")
+
+        X = np.ascontiguousarray(X, dtype=np.float32)
+
         if init_centroids is None:
-            if self.random_state is not None:
-                np.random.seed(self.random_state)
-            self.centroids = X[np.random.choice(
-                X.shape[0], self.k, replace=False)]
+            rng = np.random.RandomState(self.random_state)
+            if self.init == 'k-means++':
+                self.centroids = _kmeans_plus_plus_init(X, self.k, rng)
+            else:
+                self.centroids = X[rng.choice(
+                    X.shape[0], self.k, replace=False)]
         else:
-            self.centroids = init_centroids
+            self.centroids = np.ascontiguousarray(
+                init_centroids, dtype=np.float32)
+
+        sums = np.empty_like(self.centroids)
+        counts = np.empty(self.k, dtype=np.int64)
+        labels = np.empty(X.shape[0], dtype=np.int64)
+        prev_labels = np.full(X.shape[0], -1, dtype=np.int64)
+
+        step = _kmeans_step
+        if step is _faiss_step:
+            step = partial(_faiss_step, index=faiss.IndexFlatL2(X.shape[1]))
 
         for i in range(max_iter):
-            # Assign each data point to the nearest centroid
-            distances = np.linalg.norm(
-                X[:, np.newaxis, :] - self.centroids, axis=2)
-            labels = np.argmin(distances, axis=1)
+            # Assign each data point to the nearest centroid and accumulate the
+            # per-cluster sums and counts
+            step(X, self.centroids, sums, counts, labels)
 
-            # Update centroids to be the mean of the assigned data points
-            new_centroids = np.array(
-                [X[labels == j].mean(axis=0) for j in range(self.k)])
+            # Unchanged assignments mean the centroids would not move either
+            if np.array_equal(labels, prev_labels):
+                break
+            # Swap buffers; prev_labels now holds this iteration's assignment
+            labels, prev_labels = prev_labels, labels
+
+            # Update centroids to be the mean of the assigned data points,
+            # keeping the previous centroid for any cluster left empty
+            new_centroids = self.centroids.copy()
+            nonempty = counts > 0
+            new_centroids[nonempty] = sums[nonempty] / \
+                counts[nonempty, np.newaxis]
 
             # Check for convergence
-            if np.allclose(self.centroids, new_centroids):
+            shift = np.sqrt(((new_centroids - self.centroids) ** 2).sum())
+            self.centroids = new_centroids
+            if shift < tol:
                 break
-            else:
-                self.centroids = new_centroids
 
-        return self.centroids, labels
+        return self.centroids, prev_labels
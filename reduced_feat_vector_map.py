@@ -9,9 +9,11 @@ def mapping(feature_dict, reduced_feat_vector):
     Returns:
     - feature_dict (dict): A dictionary containing image file names as keys and the corresponding reduced feature vectors as values.
     """
-    # Loop through each reduced feature vector and its corresponding key in the feature_dict
-    for reduced_vector, key in zip(reduced_feat_vector, feature_dict.keys()):
-        # Map the reduced feature vector to the key in the feature_dict
-        feature_dict[key] = reduced_vector
+    if len(reduced_feat_vector) != len(feature_dict):
+        raise ValueError(f"Expected {len(feature_dict)} reduced feature vectors, "
+                         f"got {len(reduced_feat_vector)}")
+    # Map each key in the feature_dict to its reduced feature vector in a single C-level update;
+    # only existing keys are overwritten, so the dict can be iterated while it is updated
+    feature_dict.update(zip(feature_dict, reduced_feat_vector))
     # Return the updated feature_dict
     return feature_dict
@@ -0,0 +1,20 @@
+"""
+Builds the optional compiled kernels in _fast.pyx.
+
+Usage:
+    python setup.py build_ext --inplace
+"""
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+extension = Extension(
+    '_fast',
+    ['_fast.pyx'],
+    extra_compile_args=['-O3', '-march=native', '-fopenmp', '-ffast-math'],
+    extra_link_args=['-fopenmp'],
+)
+
+setup(
+    name='visual-search-fast',
+    ext_modules=cythonize(extension),
+)
@@ -1,8 +1,6 @@
-import random
 import numpy as np
 
-from pymilvus import connections, Collection, FieldSchema, CollectionSchema, DataType
-from sklearn.metrics.pairwise import cosine_similarity
+from pymilvus import connections, utility, Collection, FieldSchema, CollectionSchema, DataType
 
 class VectorDatabase:
     """
@@ -16,9 +14,17 @@ class VectorDatabase:
         The hostname or IP address of the Milvus server. Defaults to '127.0.0.1'.
     port : str, optional
         The port number of the Milvus server. Defaults to '19530'.
+    dim : int, optional
+        The dimensionality of the stored vectors. Defaults to 2.
     """
 
-    def __init__(self, collection_name, host='127.0.0.1', port='19530'):
+    # HNSW graph with SQ8-compressed vectors, searched server-side by Milvus. The COSINE
+    # metric normalizes inside the index, so the raw vectors are stored unchanged.
+    INDEX_PARAMS = {'index_type': 'HNSW_SQ', 'metric_type': 'COSINE',
+                    'params': {'M': 30, 'efConstruction': 200}}
+    SEARCH_PARAMS = {'metric_type': 'COSINE', 'params': {'ef': 100}}
+
+    def __init__(self, collection_name, host='127.0.0.1', port='19530', dim=2):
         """
         Initializes the VectorDatabase object and connects to the Milvus server.
 
@@ -30,34 +36,51 @@ class VectorDatabase:
             The hostname or IP address of the Milvus server. Defaults to '127.0.0.1'.
         port : str, optional
             The port number of the Milvus server. Defaults to '19530'.
+        dim : int, optional
+            The dimensionality of the stored vectors. Defaults to 2.
         """
         self.collection_name = collection_name
-        self.client = connections.connect(host, port)
+        self.dim = dim
+        connections.connect(host=host, port=port)
         self.collection = self._get_collection()
-        # A dictionary to store vector ids and their corresponding index in the vectors array
-        self.vector_ids = {}
-        self.vectors = {}  # A dictionary to store vectors, grouped by their cosine similarity
 
     def _get_collection(self):
         """
-        Gets or creates the collection with the specified name.
+        Gets or creates the collection with the specified name, builds its search index and
+        loads it into memory.
 
         Returns
         -------
         Collection
             The collection object.
+
+        Raises
+        ------
+        ValueError
+            If the existing index uses a different metric than INDEX_PARAMS.
         """
-        if self.collection_name in self.client.list_collections():
-            return Collection(self.collection_name)
+        if utility.has_collection(self.collection_name):
+            collection = Collection(self.collection_name)
         else:
             collection_schema = CollectionSchema(
-                self.collection_name,
                 fields=[
-                    FieldSchema(name='feature', dtype=DataType.FLOAT_VECTOR, dim=2)
+                    FieldSchema(name='id', dtype=DataType.INT64, is_primary=True, auto_id=True),
+                    FieldSchema(name='feature', dtype=DataType.FLOAT_VECTOR, dim=self.dim)
                 ],
                 description="Reduced feature vectors for image data"
             )
-            return Collection.create(collection_schema)
+            collection = Collection(self.collection_name, collection_schema)
+        if not collection.has_index():
+            collection.create_index('feature', self.INDEX_PARAMS)
+        else:
+            metric_type = collection.index().params.get('metric_type')
+            if metric_type != self.INDEX_PARAMS['metric_type']:
+                raise ValueError(
+                    f"Collection '{self.collection_name}' is indexed with the {metric_type} metric, "
+                    f"expected {self.INDEX_PARAMS['metric_type']}; drop the collection with "
+                    f"utility.drop_collection() so it is recreated")
+        collection.load()
+        return collection
 
     def insert_vectors(self, vectors):
         """
@@ -67,65 +90,18 @@ class VectorDatabase:
         ----------
         vectors : List[np.ndarray]
             A list of feature vectors, each represented as a numpy array.
-        """
-        entities = [{"feature": vector} for vector in vectors]
-        ids = self._generate_unique_ids(len(vectors))
-        self.collection.insert(entities, ids)
-        # Add vectors to appropriate groups based on cosine similarity
-        for vector, id_ in zip(vectors, ids):
-            self._add_vector_to_group(vector, id_)
-
-
-    def _generate_unique_ids(self, num_ids):
-        """
-        Generates a list of unique IDs.
-
-        Parameters
-        ----------
-        num_ids : int
-            The number of IDs to generate.
 
         Returns
         -------
         List[int]
-            A list of unique IDs.
-        """
-        existing_ids = set(self.collection.list_id())
-        unique_ids = []
-        while len(unique_ids) < num_ids:
-            new_id = random.randint(0, 10000000)
-            if new_id not in existing_ids:
-                unique_ids.append(new_id)
-                existing_ids.add(new_id)
-        return unique_ids
-
-    
-    def _add_vector_to_group(self, vector, id_):
+            The IDs assigned to the inserted vectors.
         """
-        Adds a vector to the appropriate group based on cosine similarity.
+        # Milvus assigns the primary keys, so only the feature column is sent
+        features = np.ascontiguousarray(np.vstack(vectors), dtype=np.float32)
+        result = self.collection.insert([features])
+        return result.primary_keys
 
-        Parameters
-        ----------
-        vector : np.ndarray
-            The vector represented as a numpy array.
-        id_ : int
-            The ID of the vector.
-        """
-        # Compute cosine similarity with all existing vectors
-        cosine_similarities = []
-        for group in self.vectors.values():
-            for v in group:
-                cosine_similarities.append(cosine_similarity([vector], [v])[0][0])
-        # Find the group with the highest cosine similarity
-        max_similarity = max(cosine_similarities, default=0)
-        for similarity, group in self.vectors.items():
-            if max_similarity == similarity:
-                group.append(vector)
-                break
-            else:
-                self.vectors[max_similarity] = [vector]
-    
-    def get_similar_vectors(self, vector, threshold=0.8):
+    def get_similar_vectors(self, vector, threshold=0.8, topk=10):
         """
         Retrieves a list of vectors from the collection that are similar to the given vector based on cosine similarity.
 
@@ -135,19 +111,25 @@ class VectorDatabase:
             The vector to search for, represented as a numpy array.
         threshold : float, optional
             The minimum cosine similarity required for a vector to be considered similar. Defaults to 0.8.
+        topk : int, optional
+            The maximum number of nearest neighbours to retrieve from the index. Defaults to 10.
 
         Returns
         -------
         List[np.ndarray]
             A list of vectors that are similar to the given vector.
         """
-        similar_vectors = []
-        for group in self.vectors.values():
-            for v in group:
-                cosine_sim = cosine_similarity([vector], [v])[0][0]
-                if cosine_sim >= threshold:
-                    similar_vectors.append(v)
-        return similar_vectors
+        results = self.collection.search(
+            data=[np.asarray(vector, dtype=np.float32).tolist()],
+            anns_field='feature',
+            param=self.SEARCH_PARAMS,
+            limit=topk,
+            expr=None,
+            output_fields=['feature'],
+        )
+        # With the COSINE metric the returned distance is the cosine similarity
+        return [np.asarray(hit.entity.get('feature')) for hit in results[0]
+                if hit.distance >= threshold]
 
     def get_vector_by_id(self, id_):
         """
@@ -170,7 +152,7 @@ class VectorDatabase:
         Deletes all vectors from the collection and recreates it with the same schema.
         """
         self.collection.drop()
-        self._get_collection()
+        self.collection = self._get_collection()
 
     def get_collection_info(self):
         """